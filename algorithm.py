@@ -1,6 +1,7 @@
 import time
 
 import gmpy2
+import numpy as np
 from collections import OrderedDict
 
 from typing import List
@@ -24,6 +25,7 @@ def orders_to_waves(order_set: set) -> list:
             Add all orders to a wave with minimal cost till this wave contains 250 articles.
 
     :param order_set: Set of orders (-> This makes the algorithm non-deterministic, because sets pop items arbitrary )
+                      A list of orders sorted by order_id can be passed instead to get deterministic waves.
     :return: List of waves
     """
     waves = []
@@ -131,8 +133,9 @@ def transform_article_dict(wave: Wave, articles_id_mapping: dict):
     # This is like a transformation of the given dict.
     # Instead of a list of articles and its attributes (e.g. warehouse),
     #   we transform it into a OrderedDict of warehouses with its articles
+    # Orders are visited by order_id, because iterating over the set of orders is arbitrary
     articles_location_mapping = OrderedDict()
-    for order in wave.orders:
+    for order in sorted(wave.orders, key=lambda o: o.order_id):
         for article in order.articles:
             try:
                 articles_location_mapping[article.warehouse_id].append((article.article_id, order.order_id))
@@ -167,7 +170,98 @@ def transform_article_dict(wave: Wave, articles_id_mapping: dict):
     return articles_location_mapping
 
 
-def articles_to_batch(wave: Wave, articles_id_mapping: dict) -> List[Batch]:
+def fill_batch_first_fit(batch: Batch, warehouse: OrderedDict) -> list:
+    """
+    Fills the batch with FULL aisles of the warehouse. The aisles are visited in the order of the OrderedDict and
+    every aisle that still fits into the batch is added (first-fit).
+
+    :param batch: a Batch object that is already partly filled
+    :param warehouse: OrderedDict of aisles (see transform_article_dict)
+    :return: list of aisle_ids that were added to the batch
+    """
+    aisle_ids_to_pop = []
+    for aisle_id, aisle in warehouse.items():
+
+        # Check if full aisle fits into batch
+        aisle_volume = sum([article[0].volume for article in aisle])
+        if batch.volume + aisle_volume <= batch.max_batch_volume:
+            for article, order_id in aisle:
+                batch.add(article, order_id)
+            aisle_ids_to_pop.append(aisle_id)
+
+    return aisle_ids_to_pop
+
+
+def fill_batch_subset_sum(batch: Batch, warehouse: OrderedDict) -> list:
+    """
+    Fills the batch with FULL aisles of the warehouse, so that the remaining capacity of the batch is used as much as
+    possible. This is a subset-sum problem over the aisle volumes, which we solve with dynamic programming:
+        reachable[v] is True, if there is a combination of aisles with a total volume of v.
+        Adding an aisle with volume w is then just reachable[w:] |= reachable[:-w], which NumPy does vectorized.
+        first_aisle[v] remembers the aisle, which made the volume v reachable for the first time. Therefore
+        v - volume(first_aisle[v]) was reachable with earlier aisles only and we can walk back to 0 to get the aisles.
+    Aisles without volume are always added, like first-fit does, because they fit into every batch.
+
+    :param batch: a Batch object that is already partly filled
+    :param warehouse: OrderedDict of aisles (see transform_article_dict)
+    :return: list of aisle_ids that were added to the batch
+    """
+    capacity = batch.max_batch_volume - batch.volume
+    aisle_ids = list(warehouse)
+    aisle_volumes = [sum([article[0].volume for article in warehouse[aisle_id]]) for aisle_id in aisle_ids]
+
+    reachable = np.zeros(capacity + 1, dtype=bool)
+    reachable[0] = True
+    first_aisle = np.full(capacity + 1, -1, dtype=np.int32)
+
+    for i, aisle_volume in enumerate(aisle_volumes):
+
+        # Aisles which do not fit at all can not improve the filling, aisles without volume are added anyway
+        if aisle_volume == 0 or aisle_volume > capacity:
+            continue
+
+        newly_reachable = reachable[:-aisle_volume] & ~reachable[aisle_volume:]
+        first_aisle[aisle_volume:][newly_reachable] = i
+        reachable[aisle_volume:] |= newly_reachable
+
+    # Walk back from the largest reachable volume to collect the aisles of this combination
+    volume = int(np.flatnonzero(reachable)[-1])
+    chosen = set(i for i, aisle_volume in enumerate(aisle_volumes) if aisle_volume == 0)
+    while volume > 0:
+        i = int(first_aisle[volume])
+        chosen.add(i)
+        volume -= aisle_volumes[i]
+
+    # Keep the order of the warehouse, so that the batch items are added in the same way as first-fit would do
+    aisle_ids_to_pop = [aisle_id for i, aisle_id in enumerate(aisle_ids) if i in chosen]
+    for aisle_id in aisle_ids_to_pop:
+        for article, order_id in warehouse[aisle_id]:
+            batch.add(article, order_id)
+
+    return aisle_ids_to_pop
+
+
+PACKING_FUNCTIONS = {
+    "first_fit": fill_batch_first_fit,
+    "subset_sum": fill_batch_subset_sum,
+}
+
+
+def articles_to_batch(wave: Wave, articles_id_mapping: dict, packing: str = "first_fit") -> List[Batch]:
+    """
+    Distributes the articles of a wave into batches. Every batch starts with an aisle and the remaining capacity is
+    filled with FULL aisles of the same warehouse.
+
+    :param wave: a Wave object that holds order_ids
+    :param articles_id_mapping: the initial article_id_mapping dict
+    :param packing: how to fill a batch with full aisles: "first_fit" or "subset_sum" (see PACKING_FUNCTIONS)
+    :return: List of batches
+    """
+    try:
+        fill_batch = PACKING_FUNCTIONS[packing]
+    except KeyError:
+        raise ValueError(f'Unknown packing {packing}. Use one of {", ".join(PACKING_FUNCTIONS)}.')
+
     batches = []
 
     # Transform Dict of articles into dict of warehouses and its aisles
@@ -212,15 +306,7 @@ def articles_to_batch(wave: Wave, articles_id_mapping: dict) -> List[Batch]:
                 # Aisles splitting produces more costs than just doing an aisle per batch.
                 # Filling a full aisle, reduces costs.
                 except IndexError:
-                    aisle_ids_to_pop = []
-                    for aisle_id, aisle in warehouse.items():
-
-                        # Check if full aisle fits into batch
-                        aisle_volume = sum([article[0].volume for article in aisle])
-                        if batch.volume + aisle_volume <= batch.max_batch_volume:
-                            for article, order_id in aisle:
-                                batch.add(article, order_id)
-                            aisle_ids_to_pop.append(aisle_id)
+                    aisle_ids_to_pop = fill_batch(batch, warehouse)
 
                     # Remove all aisles which were added to the batch
                     for aisle_id in aisle_ids_to_pop:
@@ -232,12 +318,13 @@ def articles_to_batch(wave: Wave, articles_id_mapping: dict) -> List[Batch]:
     return batches
 
 
-def distribute_orders(order_set: set, articles_id_mapping: dict):
+def distribute_orders(order_set: set, articles_id_mapping: dict, packing: str = "first_fit"):
     """
     Main function to distribute all orders into waves and batches.
 
     :param order_set:
     :param articles_id_mapping:
+    :param packing: how to fill batches with full aisles (see articles_to_batch)
     :return:
     """
     t0 = time.time()
@@ -247,7 +334,7 @@ def distribute_orders(order_set: set, articles_id_mapping: dict):
 
     batches = []
     for wave in waves:
-        res = articles_to_batch(wave, articles_id_mapping)
+        res = articles_to_batch(wave, articles_id_mapping, packing)
         batches += res
         wave.batch_ids = [batch.batch_id for batch in res]
 
@@ -0,0 +1,133 @@
+"""
+This file compares the packings of articles_to_batch (first-fit vs. subset-sum) on a random problem instance.
+
+Before that, it verifies fill_batch_subset_sum against a brute force search on small random warehouses.
+For every packing it reports the number of batches, the costs and the runtime per call of the packing function
+(once for every warehouse of every wave). The same seed always gives the same instance and the same waves.
+
+Usage: python benchmark.py [order_count] [seed]
+"""
+import random
+import sys
+import time
+from collections import OrderedDict
+from itertools import combinations
+
+from algorithm import orders_to_waves, transform_article_dict, articles_to_batch, fill_batch_subset_sum, \
+    PACKING_FUNCTIONS
+from datastructures import Article, Order, Batch
+from test_solution import calc_total_cost, check_max_batch_weight
+
+
+def random_instance(order_count: int, article_count: int = 500, warehouse_count: int = 2, aisle_count: int = 20):
+    """
+    Creates a random problem instance in the same shape as main.py does.
+
+    :return: articles_id_mapping and list of orders sorted by order_id (-> orders_to_waves is deterministic)
+    """
+    Order.all_warehouse_ids = set()
+
+    articles_id_mapping = {}
+    for article_id in range(article_count):
+        article = Article(article_id=article_id, volume=random.randrange(10, 500, 10))
+        article.warehouse_id = random.randrange(warehouse_count)
+        article.aisle_id = random.randrange(aisle_count)
+        articles_id_mapping[article_id] = article
+
+    orders = []
+    for order_id in range(order_count):
+        articles = [articles_id_mapping[random.randrange(article_count)] for _ in range(random.randint(1, 10))]
+        orders.append(Order(order_id=order_id, articles=articles))
+
+    Order.cast_all_warehouse_ids_attr()
+    return articles_id_mapping, orders
+
+
+def random_warehouse(aisle_count: int) -> OrderedDict:
+    """
+    :return: OrderedDict of aisles (see transform_article_dict) with random volumes, some aisles have no volume
+    """
+    warehouse = OrderedDict()
+    for aisle_id in random.sample(range(100), aisle_count):
+        articles = [Article(article_id=i, volume=random.choice([0, 10, 250, 990, 2000, 4070]))
+                    for i in range(random.randint(1, 4))]
+        warehouse[aisle_id] = [(article, 0) for article in articles]
+    return warehouse
+
+
+def check_subset_sum_packing(warehouse_count: int = 1000):
+    """
+    Checks on random warehouses that fill_batch_subset_sum:
+        1) fills the batch as much as a brute force search over all combinations of aisles
+        2) adds every aisle at most once and in the order of the warehouse
+        3) adds every aisle without volume
+    """
+    for _ in range(warehouse_count):
+        warehouse = random_warehouse(random.randint(0, 8))
+        aisle_volumes = {aisle_id: sum([article[0].volume for article in aisle])
+                         for aisle_id, aisle in warehouse.items()}
+
+        batch = Batch()
+        batch.volume = random.randrange(0, batch.max_batch_volume + 1, 10)
+        capacity = batch.max_batch_volume - batch.volume
+
+        best_volume = max(sum([aisle_volumes[aisle_id] for aisle_id in aisle_ids])
+                          for r in range(len(warehouse) + 1) for aisle_ids in combinations(warehouse, r)
+                          if sum([aisle_volumes[aisle_id] for aisle_id in aisle_ids]) <= capacity)
+
+        aisle_ids = fill_batch_subset_sum(batch, warehouse)
+
+        assert batch.max_batch_volume - batch.volume == capacity - best_volume, "Batch is not filled optimal."
+        assert aisle_ids == [aisle_id for aisle_id in warehouse if aisle_id in aisle_ids], "Aisles are not in order."
+        assert len(aisle_ids) == len(set(aisle_ids)), "Aisles are added more than once."
+        assert all([aisle_id in aisle_ids for aisle_id, volume in aisle_volumes.items() if volume == 0]), \
+            "Aisles without volume are missing."
+
+
+def time_packing(fill_batch, waves: list, articles_id_mapping: dict) -> float:
+    """
+    :return: average runtime in seconds of fill_batch for a half full batch over all warehouses of all waves
+    """
+    calls, total = 0, 0.
+    for wave in waves:
+        for warehouse in transform_article_dict(wave, articles_id_mapping).values():
+            batch = Batch()
+            batch.volume = batch.max_batch_volume // 2
+            t0 = time.perf_counter()
+            fill_batch(batch, warehouse)
+            total += time.perf_counter() - t0
+            calls += 1
+    return total / calls
+
+
+if __name__ == "__main__":
+    order_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 0
+
+    random.seed(seed)
+    check_subset_sum_packing()
+
+    for packing, fill_batch in PACKING_FUNCTIONS.items():
+
+        # Every packing gets the same instance, because get_solution_dict empties the waves
+        random.seed(seed)
+        articles_id_mapping, orders = random_instance(order_count)
+        waves = orders_to_waves(orders)
+
+        batches = []
+        for wave in waves:
+            res = articles_to_batch(wave, articles_id_mapping, packing)
+            batches += res
+            wave.batch_ids = [batch.batch_id for batch in res]
+
+        packing_time = time_packing(fill_batch, waves, articles_id_mapping)
+
+        solution = {
+            "Waves": [wave.get_solution_dict() for wave in waves],
+            "Batches": [batch.get_solution_dict() for batch in batches]
+        }
+        assert check_max_batch_weight(solution["Batches"]), "Batch limit is violated."
+
+        print(f"{packing:>10}: {len(batches): 5d} batches, "
+              f"total cost {calc_total_cost(solution, articles_id_mapping): 6d}, "
+              f"{packing_time * 1e6: 6.1f} µs per warehouse")
@@ -1,7 +1,7 @@
 import json
 import sys
 from datastructures import Article, Order
-from algorithm import distribute_orders
+from algorithm import distribute_orders, PACKING_FUNCTIONS
 from test_solution import check_solution
 import os
 
@@ -15,6 +15,11 @@ def main(argv):
     except IndexError:
         raise ValueError('instance_path and/or solution_path is missing.')
 
+    # optional: how batches are filled with full aisles ("first_fit" or "subset_sum")
+    packing = argv[3] if len(argv) > 3 else "first_fit"
+    if packing not in PACKING_FUNCTIONS:
+        raise ValueError(f'Unknown packing {packing}. Use one of {", ".join(PACKING_FUNCTIONS)}.')
+
     # check if the solution directory exists before importing the problem instance and calculating a solution
     solution_dir, _ = os.path.split(solution_path)
     if solution_dir and not os.path.isdir(solution_dir):
@@ -52,7 +57,7 @@ def main(argv):
     Order.cast_all_warehouse_ids_attr()
 
     # calculate the solution dict
-    solution = distribute_orders(orders, articles_id_mapping)
+    solution = distribute_orders(orders, articles_id_mapping, packing)
 
     # Solution test function which checks logical correctness and calculates costs.
     # check_solution(solution, articles_id_mapping, data["Orders"])